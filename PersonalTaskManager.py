@@ -1,17 +1,81 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
-from datetime import datetime
+import os
+import re
+import calendar
 import uuid
+import itertools
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# New task ids: a per-process random prefix plus a counter, so only one uuid4() call is made
+_ID_PREFIX = uuid.uuid4().hex
+_ID_COUNTER = itertools.count()
+
+def _make_id():
+    return f"{_ID_PREFIX}-{next(_ID_COUNTER):08x}"
+
+# Pack a YYYY-MM-DD string into an int (e.g. 20240131) for cheap comparisons;
+# malformed stored dates get 0 so they still load and sort first
+def _date_key(due_date):
+    if not isinstance(due_date, str):
+        return 0
+    try:
+        y, m, d = due_date.split("-")
+        return int(y) * 10000 + int(m) * 100 + int(d)
+    except ValueError:
+        return 0
+
+# Due dates must be YYYY-MM-DD and a real calendar day
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+def _valid_ymd(year, month, day):
+    return year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
+
+def _valid_date(value):
+    m = _DATE_RE.fullmatch(value)
+    return bool(m) and _valid_ymd(*map(int, m.groups()))
+
+# Priorities as bit positions so filters can test a mask; unknown values share one
+# bit and are then matched by name
+_PRIO_IDX = {"High": 0, "Medium": 1, "Low": 2}
+_PRIO_OTHER = 3
+
+def _priority_mask(priorities):
+    mask = 0
+    for priority in priorities:
+        mask |= 1 << _PRIO_IDX.get(priority, _PRIO_OTHER)
+    return mask
 
 # Task class
+# A slotted dataclass lets orjson serialize tasks directly; it leaves out the
+# underscore-prefixed cached fields
+@dataclass(slots=True, init=False, eq=False)
 class Task:
+    id: str
+    name: str
+    description: str
+    priority: str
+    due_date: str
+    _name_lower: str = field(repr=False)
+    _due_key: int = field(repr=False)
+    _prio_idx: int = field(repr=False)
+
     def __init__(self, name, description, priority, due_date, task_id=None):
-        self.id = task_id or str(uuid.uuid4())
+        self.id = task_id or _make_id()
         self.name = name
+        self._name_lower = name.lower()  # cached for name filtering
         self.description = description
         self.priority = priority
+        self._prio_idx = _PRIO_IDX.get(priority, _PRIO_OTHER)
         self.due_date = due_date
+        self._due_key = _date_key(due_date)
 
     def to_dict(self):
         return {
@@ -24,63 +88,132 @@ class Task:
 
 # Task Manager
 class TaskManager:
-    def __init__(self, filename="tasks.json"):
+    def __init__(self, filename="tasks.json", root=None):
         self.filename = filename
+        self.root = root  # Tk widget used to defer writes; None saves immediately
+        self._dirty = False
+        self._save_job = None
+        self._sort_cache = {}  # column key -> sorted task list, cleared on mutation
+        self._last_filter = None  # (name, priority, due key, result) of the previous filter
         self.tasks = self.load_tasks()
 
     def load_tasks(self):
         try:
-            with open(self.filename, "r") as file:
-                data = json.load(file)
-                return [Task(
+            with open(self.filename, "rb") as file:
+                raw = file.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                loaded = [Task(
                     name=task["name"],
                     description=task["description"],
                     priority=task["priority"],
                     due_date=task["due_date"],
                     task_id=task["id"]
                 ) for task in data]
+                # Key on the Task's own id; a blank stored id is replaced on construction
+                return {t.id: t for t in loaded}
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            return {}
 
     def save_tasks(self):
-        with open(self.filename, "w") as file:
-            json.dump([task.to_dict() for task in self.tasks], file, indent=4)
+        # Coalesce bursts of mutations into a single write once things go quiet
+        self._dirty = True
+        if self.root is None:
+            self._flush()
+            return
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(500, self._flush)
+
+    def _flush(self):
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        if not self._dirty:
+            return
+        # Write to a temp file, sync it to disk and swap it in so a crash or power
+        # loss never leaves a half-written file
+        tmp = self.filename + ".tmp"
+        try:
+            if orjson:
+                with open(tmp, "wb") as file:
+                    file.write(orjson.dumps(list(self.tasks.values()), option=orjson.OPT_INDENT_2))
+                    file.flush()
+                    os.fsync(file.fileno())
+            else:
+                with open(tmp, "w") as file:
+                    json.dump([task.to_dict() for task in self.tasks.values()], file, indent=4)
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.replace(tmp, self.filename)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
 
     def add_task(self, task):
-        self.tasks.append(task)
+        self.tasks[task.id] = task
+        self._invalidate_caches()
         self.save_tasks()
 
     def update_task(self, task_id, updated_task):
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                self.tasks[i] = updated_task
-                self.save_tasks()
-                return True
+        if task_id in self.tasks:
+            self.tasks[task_id] = updated_task
+            self._invalidate_caches()
+            self.save_tasks()
+            return True
         return False
 
     def delete_task(self, task_id):
-        self.tasks = [task for task in self.tasks if task.id != task_id]
-        self.save_tasks()
+        if self.tasks.pop(task_id, None) is not None:
+            self._invalidate_caches()
+            self.save_tasks()
+
+    def _invalidate_caches(self):
+        self._sort_cache.clear()
+        self._last_filter = None
 
     def filter_tasks(self, name_filter="", priority_filter="All", due_date_filter=""):
-        filtered = self.tasks
-        if name_filter:
-            filtered = [t for t in filtered if name_filter.lower() in t.name.lower()]
-        if priority_filter != "All":
-            filtered = [t for t in filtered if t.priority == priority_filter]
-        if due_date_filter:
-            filtered = [t for t in filtered if t.due_date == due_date_filter]
+        # Single pass over the tasks; unused filters are None and short-circuit
+        nf = name_filter.lower() if name_filter else None
+        # priority_filter is "All", a single priority, or a collection for multi-select
+        if priority_filter == "All":
+            pf = pf_names = None
+        else:
+            pf_names = frozenset((priority_filter,) if isinstance(priority_filter, str) else priority_filter)
+            pf = _priority_mask(pf_names)
+        df = _date_key(due_date_filter) if due_date_filter else None
+        # While the user keeps typing, the new name contains the previous one, so
+        # only the previous matches need to be rescanned
+        candidates = self.tasks.values()
+        last = self._last_filter
+        if last and nf and last[0] and last[0] in nf and last[1:3] == (pf_names, df):
+            candidates = last[3]
+        filtered = [t for t in candidates
+                    if (nf is None or nf in t._name_lower)
+                    and (pf is None or (pf >> t._prio_idx) & 1
+                         and (t._prio_idx != _PRIO_OTHER or t.priority in pf_names))
+                    and (df is None or t._due_key == df)]
+        self._last_filter = (nf, pf_names, df, filtered)
         return filtered
 
     def sort_tasks(self, key):
-        return sorted(self.tasks, key=lambda task: getattr(task, key))
+        if key not in self._sort_cache:
+            attr = "_due_key" if key == "due_date" else key
+            self._sort_cache[key] = sorted(self.tasks.values(), key=attrgetter(attr))
+        return self._sort_cache[key]
 
 # GUI class with color and frame
 class TaskGUI:
+    PAGE_SIZE = 100  # rows inserted into the Treeview per batch
+
     def __init__(self, root):
-        self.manager = TaskManager()
+        self.manager = TaskManager(root=root)
         self.root = root
         self.root.title("Personal Task Manager")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Style
         self.style = ttk.Style()
@@ -96,15 +229,11 @@ class TaskGUI:
         add_frame.pack(pady=10, fill="x") # Fill makes it expand horizontally
 
         self.name_entry = tk.Entry(add_frame)
-        self.name_entry.insert(0, "Task Name")
-        self.name_entry.bind("<FocusIn>", self.clear_name_placeholder)
-        self.name_entry.bind("<FocusOut>", self.reset_name_placeholder)
+        self._bind_placeholder(self.name_entry, "Task Name")
         self.name_entry.grid(row=0, column=0, padx=5, sticky="ew") # Sticky makes it expand
 
         self.desc_entry = tk.Entry(add_frame)
-        self.desc_entry.insert(0, "Description")
-        self.desc_entry.bind("<FocusIn>", self.clear_desc_placeholder)
-        self.desc_entry.bind("<FocusOut>", self.reset_desc_placeholder)
+        self._bind_placeholder(self.desc_entry, "Description")
         self.desc_entry.grid(row=0, column=1, padx=5, sticky="ew")
 
         self.prio_cb_add = ttk.Combobox(add_frame, values=["High", "Medium", "Low"])
@@ -112,9 +241,7 @@ class TaskGUI:
         self.prio_cb_add.grid(row=0, column=2, padx=5, sticky="ew")
 
         self.date_entry = tk.Entry(add_frame)
-        self.date_entry.insert(0, "YYYY-MM-DD")
-        self.date_entry.bind("<FocusIn>", self.clear_date_placeholder)
-        self.date_entry.bind("<FocusOut>", self.reset_date_placeholder)
+        self._bind_placeholder(self.date_entry, "YYYY-MM-DD")
         self.date_entry.grid(row=0, column=3, padx=5, sticky="ew")
 
         tk.Button(add_frame, text="Add Task", command=self.add_task).grid(row=0, column=4, padx=5, sticky="ew")
@@ -131,6 +258,7 @@ class TaskGUI:
         for col in columns[1:]:
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_by_column(c))
             self.tree.column(col, width=120)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll) # Load more rows as the user scrolls
         self.tree.pack(fill="both", expand=True) # Fill and expand inside its frame
         self.tree.bind("<<TreeviewSelect>>", self.populate_fields_from_selection)
         self.load_table()
@@ -142,6 +270,8 @@ class TaskGUI:
         tk.Label(filter_frame, text="Search:").grid(row=0, column=0)
         self.search_entry = tk.Entry(filter_frame)
         self.search_entry.grid(row=0, column=1, sticky="ew")
+        self._filter_job = None
+        self.search_entry.bind("<KeyRelease>", self._schedule_filter)
 
         tk.Label(filter_frame, text="Priority:").grid(row=0, column=2, padx=5)
         self.priority_cb = ttk.Combobox(filter_frame, values=["All", "High", "Medium", "Low"])
@@ -159,29 +289,67 @@ class TaskGUI:
         self.tree.tag_configure("medium", foreground="orange")
         self.tree.tag_configure("low", foreground="green")
 
-    def load_table(self, tasks=None):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for task in tasks or self.manager.tasks:
-            tag = task.priority.lower()
-            self.tree.insert("", "end", values=(task.id, task.name, task.description, task.priority, task.due_date), tags=(tag,))
+    def on_close(self):
+        # Write out any pending changes before the window goes away
+        try:
+            self.manager._flush()
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Could not save tasks: {e}")
+            if not messagebox.askyesno("Save Error", "Close anyway and discard unsaved changes?"):
+                return
+            self.manager._dirty = False
+        self.root.destroy()
 
-    def apply_filters(self):
+    def load_table(self, tasks=None):
+        self.tree.delete(*self.tree.get_children())
+        # Only the first page is inserted; the rest follows on scroll
+        self._view_tasks = list(tasks if tasks is not None else self.manager.tasks.values())
+        self._loaded = 0
+        self._extend_view()
+
+    def _extend_view(self):
+        end = min(self._loaded + self.PAGE_SIZE, len(self._view_tasks))
+        for task in self._view_tasks[self._loaded:end]:
+            self.insert_row(task)
+        self._loaded = end
+
+    def _on_tree_scroll(self, first, last):
+        if float(last) >= 0.9 and self._loaded < len(self._view_tasks):
+            self._extend_view()
+
+    # Rows use the task id as their iid so single rows can be touched directly
+    def insert_row(self, task):
+        self.tree.insert("", "end", iid=task.id, values=self.row_values(task), tags=(task.priority.lower(),))
+
+    def row_values(self, task):
+        return (task.id, task.name, task.description, task.priority, task.due_date)
+
+    def apply_filters(self, show_errors=True):
         name = self.search_entry.get()
         priority = self.priority_cb.get()
         due_date = self.due_entry.get()
 
-        # Validate the due date format in the filter
-        if due_date:
-            try:
-                datetime.strptime(due_date, "%Y-%m-%d")
-            except ValueError:
+        # Validate the due date format in the filter; while typing in the search box
+        # a half-typed date is just ignored instead of popping up an error
+        if due_date and not _valid_date(due_date):
+            if show_errors:
                 messagebox.showerror("Filter Error", "Due date filter must be in YYYY-MM-DD format.")
                 return
+            due_date = ""
 
         filtered = self.manager.filter_tasks(name, priority, due_date)
         self.load_table(filtered)
 
+    def _schedule_filter(self, event):
+        # Filter once typing pauses instead of on every keystroke
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(150, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self):
+        self._filter_job = None
+        self.apply_filters(show_errors=False)
+
     def sort_by_column(self, column):
         col_key = column.lower().replace(" ", "_")                        # 
         sorted_tasks = self.manager.sort_tasks(col_key)
@@ -201,15 +369,16 @@ class TaskGUI:
             messagebox.showerror("Missing Info", "Priority is required.")
             return
 
-        try:
-            datetime.strptime(due_date, "%Y-%m-%d")
-        except ValueError:
+        if not _valid_date(due_date):
             messagebox.showerror("Date Error", "Enter date in %Y-%m-%d format.")
             return
 
         task = Task(name, description, priority, due_date)
         self.manager.add_task(task)
-        self.load_table()
+        fully_loaded = self._loaded == len(self._view_tasks)
+        self._view_tasks.append(task)
+        if fully_loaded:
+            self._extend_view()
         self.clear_add_fields()
 
     def edit_task(self):
@@ -231,15 +400,13 @@ class TaskGUI:
             messagebox.showerror("Missing Info", "Priority is required.")
             return
 
-        try:
-            datetime.strptime(due_date, "%Y-%m-%d")
-        except ValueError:
+        if not _valid_date(due_date):
             messagebox.showerror("Date Error", "Enter date in %Y-%m-%d format.")
             return
 
         updated_task = Task(name, description, priority, due_date, task_id=selected_id)
         if self.manager.update_task(selected_id, updated_task):
-            self.load_table()
+            self.tree.item(selected_id, values=self.row_values(updated_task), tags=(priority.lower(),))
             self.clear_add_fields()
         else:
             messagebox.showerror("Error", "Could not update task.")
@@ -253,67 +420,57 @@ class TaskGUI:
         confirm = messagebox.askyesno("Delete Task", "Are you sure you want to delete this task?")
         if confirm:
             self.manager.delete_task(selected_id)
-            self.load_table()
+            self.tree.delete(selected_id)
             self.clear_add_fields()
 
     def get_selected_id(self):
         selected = self.tree.selection()
-        if selected:
-            return self.tree.item(selected[0])['values'][0]
-        return None
+        return selected[0] if selected else None
 
     def populate_fields_from_selection(self, event):
         selected_id = self.get_selected_id()
-        if selected_id:
-            for task in self.manager.tasks:
-                if task.id == selected_id:
-                    self.name_entry.delete(0, tk.END)
-                    self.name_entry.insert(0, task.name)
-                    self.desc_entry.delete(0, tk.END)
-                    self.desc_entry.insert(0, task.description)
-                    self.prio_cb_add.set(task.priority)
-                    self.date_entry.delete(0, tk.END)
-                    self.date_entry.insert(0, task.due_date)
-                    break
+        if not selected_id:
+            return
+        task = self.manager.tasks.get(selected_id)
+        if task is None:
+            return
+        self._set_entry(self.name_entry, task.name)
+        self._set_entry(self.desc_entry, task.description)
+        self.prio_cb_add.set(task.priority)
+        self._set_entry(self.date_entry, task.due_date)
+
+    def _set_entry(self, entry, value):
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
 
     def clear_add_fields(self):
         self.name_entry.delete(0, tk.END)
         self.desc_entry.delete(0, tk.END)
         self.date_entry.delete(0, tk.END)
-        self.reset_name_placeholder(None)
-        self.reset_desc_placeholder(None)
-        self.reset_date_placeholder(None)
+        self._reset_placeholder(self.name_entry, "Task Name")
+        self._reset_placeholder(self.desc_entry, "Description")
+        self._reset_placeholder(self.date_entry, "YYYY-MM-DD")
         self.prio_cb_add.set("Medium")
 
-    def clear_name_placeholder(self, event):
-        if self.name_entry.get() == "Task Name":
-            self.name_entry.delete(0, tk.END)
-            self.name_entry.focus()
-
-    def reset_name_placeholder(self, event):
-        if self.name_entry.get() == "":
-            self.name_entry.insert(0, "Task Name")
-
-    def clear_desc_placeholder(self, event):
-        if self.desc_entry.get() == "Description":
-            self.desc_entry.delete(0, tk.END)
-            self.desc_entry.focus()
-
-    def reset_desc_placeholder(self, event):
-        if self.desc_entry.get() == "":
-            self.desc_entry.insert(0, "Description")
+    def _bind_placeholder(self, entry, text):
+        entry.insert(0, text)
+        entry.bind("<FocusIn>", lambda event: self._clear_placeholder(entry, text))
+        entry.bind("<FocusOut>", lambda event: self._reset_placeholder(entry, text))
 
-    def clear_date_placeholder(self, event):
-        if self.date_entry.get() == "YYYY-MM-DD":
-            self.date_entry.delete(0, tk.END)
-            self.date_entry.focus()
+    def _clear_placeholder(self, entry, text):
+        if entry.get() == text:
+            entry.delete(0, tk.END)
 
-    def reset_date_placeholder(self, event):
-        if self.date_entry.get() == "":
-            self.date_entry.insert(0, "YYYY-MM-DD")
+    def _reset_placeholder(self, entry, text):
+        if entry.get() == "":
+            entry.insert(0, text)
 
 # Run Personal task manager
 if __name__ == "__main__":
     root = tk.Tk()
     app = TaskGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        # Save edits still waiting on the debounce if the loop ends another way (e.g. Ctrl+C)
+        app.manager._flush()
@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+import unittest
+
+from PersonalTaskManager import Task, TaskManager, _valid_date
+
+
+class TaskManagerTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.dir.name, "tasks.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write_tasks(self, tasks):
+        with open(self.filename, "w") as file:
+            json.dump(tasks, file)
+
+    def test_load_tasks_with_malformed_due_date(self):
+        self.write_tasks([
+            {"id": "a", "name": "Bad", "description": "", "priority": "Low", "due_date": ""},
+            {"id": "b", "name": "Odd", "description": "", "priority": "Low", "due_date": "soon"},
+            {"id": "c", "name": "Null", "description": "", "priority": "Low", "due_date": None},
+            {"id": "d", "name": "Number", "description": "", "priority": "Low", "due_date": 20240131},
+            {"id": "e", "name": "Good", "description": "", "priority": "High", "due_date": "2024-01-31"},
+        ])
+
+        manager = TaskManager(self.filename)
+
+        self.assertEqual(list(manager.tasks), ["a", "b", "c", "d", "e"])
+        self.assertEqual([t.id for t in manager.sort_tasks("due_date")], ["a", "b", "c", "d", "e"])
+        self.assertEqual([t.id for t in manager.filter_tasks(due_date_filter="2024-01-31")], ["e"])
+
+    def test_save_and_reload(self):
+        manager = TaskManager(self.filename)
+        manager.add_task(Task("Saved", "", "Low", "2024-01-31"))
+        self.assertEqual(list(TaskManager(self.filename).tasks), list(manager.tasks))
+        self.assertEqual(os.listdir(self.dir.name), ["tasks.json"])
+
+        # Edits made outside the app are picked up on the next load
+        self.write_tasks([])
+        self.assertEqual(TaskManager(self.filename).tasks, {})
+
+    def test_blank_stored_id_gets_usable_key(self):
+        self.write_tasks([
+            {"id": "", "name": "Blank", "description": "", "priority": "Low", "due_date": "2024-01-31"},
+        ])
+
+        manager = TaskManager(self.filename)
+        (task_id, task), = manager.tasks.items()
+
+        self.assertTrue(task_id)
+        self.assertEqual(task_id, task.id)
+        self.assertTrue(manager.update_task(task_id, Task("Renamed", "", "Low", "2024-01-31", task_id=task_id)))
+        manager.delete_task(task_id)
+        self.assertEqual(manager.tasks, {})
+
+    def names(self, tasks):
+        return [t.name for t in tasks]
+
+    def test_filter_narrows_from_previous_result(self):
+        manager = TaskManager(self.filename)
+        for name in ("Alpha", "Gamma", "alps", "Beta"):
+            manager.add_task(Task(name, "", "Low", "2024-01-31"))
+
+        self.assertEqual(self.names(manager.filter_tasks("al")), ["Alpha", "alps"])
+        self.assertEqual(self.names(manager.filter_tasks("alp")), ["Alpha", "alps"])
+        # A shorter query is not contained in the previous one and must rescan everything
+        self.assertEqual(self.names(manager.filter_tasks("a")), ["Alpha", "Gamma", "alps", "Beta"])
+
+    def test_filter_does_not_reuse_result_across_other_filters(self):
+        manager = TaskManager(self.filename)
+        manager.add_task(Task("Alpha", "", "High", "2024-01-31"))
+        manager.add_task(Task("alps", "", "Low", "2024-02-01"))
+
+        self.assertEqual(self.names(manager.filter_tasks("al", "High")), ["Alpha"])
+        self.assertEqual(self.names(manager.filter_tasks("alp", "Low")), ["alps"])
+        self.assertEqual(self.names(manager.filter_tasks("alp", "All", "2024-01-31")), ["Alpha"])
+        self.assertEqual(self.names(manager.filter_tasks("alps", "All", "2024-02-01")), ["alps"])
+
+    def test_filter_sees_mutations_between_queries(self):
+        manager = TaskManager(self.filename)
+        first = Task("Alpha", "", "Low", "2024-01-31")
+        manager.add_task(first)
+        self.assertEqual(self.names(manager.filter_tasks("al")), ["Alpha"])
+
+        manager.add_task(Task("alpine", "", "Low", "2024-01-31"))
+        self.assertEqual(self.names(manager.filter_tasks("alp")), ["Alpha", "alpine"])
+
+        manager.delete_task(first.id)
+        self.assertEqual(self.names(manager.filter_tasks("alpi")), ["alpine"])
+
+        second = manager.filter_tasks("alpi")[0]
+        manager.update_task(second.id, Task("Alpinist", "", "Low", "2024-01-31", task_id=second.id))
+        self.assertEqual(self.names(manager.filter_tasks("alpin")), ["Alpinist"])
+
+    def test_filter_by_priority_set(self):
+        manager = TaskManager(self.filename)
+        for name, priority in (("a", "High"), ("b", "Medium"), ("c", "Low"), ("d", "high"), ("e", "Urgent")):
+            manager.add_task(Task(name, "", priority, "2024-01-31"))
+
+        self.assertEqual(self.names(manager.filter_tasks(priority_filter={"High", "Medium"})), ["a", "b"])
+        self.assertEqual(self.names(manager.filter_tasks(priority_filter=["high"])), ["d"])
+        self.assertEqual(self.names(manager.filter_tasks(priority_filter=[])), [])
+        # Custom priorities share one bit but are still matched by name
+        self.assertEqual(self.names(manager.filter_tasks(priority_filter="High")), ["a"])
+        self.assertEqual(self.names(manager.filter_tasks(priority_filter="Urgent")), ["e"])
+        self.assertEqual(self.names(manager.filter_tasks(priority_filter="Other")), [])
+
+
+class ValidDateTests(unittest.TestCase):
+    def test_calendar_days(self):
+        self.assertTrue(_valid_date("2024-02-29"))
+        self.assertFalse(_valid_date("2023-02-29"))
+        self.assertFalse(_valid_date("2024-13-01"))
+        self.assertFalse(_valid_date("0000-01-01"))
+
+    def test_format(self):
+        self.assertTrue(_valid_date("2024-01-05"))
+        self.assertFalse(_valid_date("2024-1-5"))
+        self.assertFalse(_valid_date("2024-01-01\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()